@@ -1,9 +1,5 @@
-import requests
 import streamlit as st
-from bs4 import BeautifulSoup
-import pandas as pd
-from OpenFDA import OpenFDA
-from ClinicalTrials import ClinicalTrials
+from clintrial import ClinicalTrials, OpenFDA
 
 
 def query_fda(term):
@@ -0,0 +1,112 @@
+"""Cold-start benchmark for the clintrial package.
+
+Checks two budgets, each measured in a fresh interpreter:
+
+- import: time to ``import clintrial`` (over a bare interpreter start), and
+  that no heavy module (requests, pandas, streamlit, bs4) is loaded by it.
+- first request: time to import, construct ``ClinicalTrials`` and complete a
+  first ``get_full_studies`` call against a local stub server, so the number
+  reflects the library's own overhead rather than the network.
+
+Run from the repository root::
+
+    python benchmarks/bench_startup.py
+
+Exits with status 1 if a budget is exceeded.
+"""
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+IMPORT_BUDGET_MS = 50
+FIRST_REQUEST_BUDGET_MS = 500
+HEAVY_MODULES = ["requests", "pandas", "streamlit", "bs4"]
+RUNS = 5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = f"""
+import sys, time
+start = time.perf_counter()
+import clintrial
+elapsed = time.perf_counter() - start
+loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+print(elapsed * 1000, ",".join(loaded))
+"""
+
+FIRST_REQUEST_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+from clintrial import ClinicalTrials
+ct = ClinicalTrials()
+ct._BASE_URL = sys.argv[1]
+ct.get_full_studies("cancer", max_rank=1)
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    body = json.dumps({"FullStudiesResponse": {"NStudiesFound": 0}}).encode()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _run(snippet, *args):
+    out = subprocess.run(
+        [sys.executable, "-c", snippet, *args],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return out.stdout.split()
+
+
+def bench_import():
+    timings, loaded = [], []
+    for _ in range(RUNS):
+        fields = _run(IMPORT_SNIPPET)
+        timings.append(float(fields[0]))
+        if len(fields) > 1:
+            loaded = fields[1].split(",")
+    best = min(timings)
+    ok = best <= IMPORT_BUDGET_MS and not loaded
+    print(f"import:        {best:8.2f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    if loaded:
+        print(f"  heavy modules loaded at import: {', '.join(loaded)}")
+    return ok
+
+
+def bench_first_request():
+    try:
+        import requests  # noqa: F401
+    except ImportError:
+        print("first request: skipped (requests is not installed)")
+        return True
+
+    server = HTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/"
+    try:
+        best = min(float(_run(FIRST_REQUEST_SNIPPET, url)[0]) for _ in range(RUNS))
+    finally:
+        server.shutdown()
+    print(f"first request: {best:8.2f} ms (budget {FIRST_REQUEST_BUDGET_MS} ms)")
+    return best <= FIRST_REQUEST_BUDGET_MS
+
+
+if __name__ == "__main__":
+    ok = bench_import()
+    ok = bench_first_request() and ok
+    sys.exit(0 if ok else 1)
@@ -1,4 +1,6 @@
-from utils import json_handler
+from functools import cached_property
+
+from .utils import json_handler
 
 
 class ClinicalTrials:
@@ -8,11 +10,17 @@ class ClinicalTrials:
     _QUERY = "query/"
     _JSON = "fmt=json"
 
-    def __init__(self):
-        self.api_info = self.__api_info()
+    @cached_property
+    def api_info(self):
+        """Returns the API version and the date the data was last updated.
+
+        Fetched on first access and cached, so constructing the client does no I/O.
+        """
+        return self.__api_info()
 
-    @property
+    @cached_property
     def study_fields(self):
+        """Returns the list of valid study fields, fetched once and cached."""
         fields_list = json_handler(
             f"{self._BASE_URL}{self._INFO}study_fields_list?{self._JSON}"
         )
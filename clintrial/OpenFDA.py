@@ -1,15 +1,21 @@
-import requests
+from functools import cached_property
+
+from .utils import json_handler
+
 
 class OpenFDA:
     def __init__(self, term):
         self.term = term
-        self.data = self.run_query()
+
+    @cached_property
+    def data(self):
+        """Returns the query results, fetched on first access and cached."""
+        return self.run_query()
 
     def run_query(self):
-        r = requests.get(
+        return json_handler(
             f"https://api.fda.gov/drug/drugsfda.json?search={self.term}&limit=100"
         )
-        return r.json()
 
     def get_ndas(self):
         ndas = []
@@ -89,6 +95,14 @@ class OpenFDA:
             return None
 
     def temp(self):
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "OpenFDA.temp requires pandas, install it with `pip install pandas`."
+            )
+
+        data = self.data
         labels = []
         for i in data["results"]:
             if i["application_number"][0] == "N":
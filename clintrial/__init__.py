@@ -0,0 +1,9 @@
+"""Clients for the ClinicalTrials.gov and openFDA APIs.
+
+Importing this package only touches the standard library; HTTP and optional
+extras (pandas) are loaded the first time they are needed.
+"""
+from .ClinicalTrials import ClinicalTrials
+from .OpenFDA import OpenFDA
+
+__all__ = ["ClinicalTrials", "OpenFDA"]
@@ -1,11 +1,11 @@
 """Basic utilities module"""
-import requests
-import csv
-import re
 
 
 def request_ct(url):
     """Performs a get request that provides a (somewhat) useful error message."""
+    # requests is imported here so that importing the package stays cheap
+    import requests
+
     try:
         response = requests.get(url)
     except ImportError: